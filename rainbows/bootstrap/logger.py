@@ -1,8 +1,11 @@
 import abc
-import asyncio
-import multiprocessing
 import os
+import queue
 import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    import asyncio
 
 
 class AbstractLogger(abc.ABC):
@@ -12,7 +15,7 @@ class AbstractLogger(abc.ABC):
     it should be stored until set_loop when it can then be added to the loop.
     """
     @abc.abstractmethod
-    def set_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+    def set_loop(self, loop: "asyncio.AbstractEventLoop") -> None:
         pass
 
     @abc.abstractmethod
@@ -34,31 +37,89 @@ class AbstractLogger(abc.ABC):
 
 class DefaultLogger(AbstractLogger):
     """The class used for the default logging class."""
+    _INFO = "ⓘ [".encode()
+    _WARN = "⚠️️ [".encode()
+    _ERROR = "❌️️ [".encode()
+    _FATAL = "⛔ [".encode()
+    _SUFFIX = b"] "
+
     def __init__(self):
-        self._thread_pool = multiprocessing.Pool(os.cpu_count())
-        self._lock = threading.Lock()
+        self._q = queue.SimpleQueue()
+        self._queued = threading.Event()
+        self._write_lock = threading.Lock()
+        self._drain_started = False
+        self._start_lock = threading.Lock()
+
+    def _put(self, line: bytes):
+        """Queues the line to be written, starting the drain thread on the first log."""
+        if not self._drain_started:
+            with self._start_lock:
+                if not self._drain_started:
+                    threading.Thread(target=self._drain, daemon=True).start()
+                    self._drain_started = True
+        self._q.put(line)
+        self._queued.set()
+
+    def _pending(self) -> typing.List[bytes]:
+        """Gets all the messages which are currently queued without blocking."""
+        lines = []
+        try:
+            while True:
+                lines.append(self._q.get_nowait())
+        except queue.Empty:
+            pass
+        return lines
+
+    @staticmethod
+    def _write(data: bytes):
+        """Writes the data to stdout, handling partial writes."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(1, view):]
+
+    def _flush(self, lines: typing.List[bytes]):
+        """Writes the lines to stdout. Errors are ignored since there is nowhere left to log them."""
+        try:
+            self._write(b"".join(lines))
+        except OSError:
+            pass
 
-    def _do_log(self, msg: str):
-        def do():
-            self._lock.acquire()
-            print(msg)
-            self._lock.release()
+    def _drain(self):
+        """
+        Writes queued messages to stdout. Runs forever in a daemon thread. Messages are only taken from the queue with
+        the write lock held, so fatal can write everything queued before it.
+        """
+        while True:
+            self._queued.wait()
+            with self._write_lock:
+                # Cleared before taking the messages so that one queued after this wakes the thread up again.
+                self._queued.clear()
+                lines = self._pending()
+                if lines:
+                    self._flush(lines)
 
-        self._thread_pool.apply_async(do)
+    def _format(self, prefix: bytes, handler: str, message: str) -> bytes:
+        return prefix + handler.encode("utf-8", "replace") + self._SUFFIX + \
+            message.encode("utf-8", "replace") + b"\n"
 
     def info(self, handler: str, message: str) -> None:
-        self._do_log(f"ⓘ [{handler}] {message}")
+        self._put(self._format(self._INFO, handler, message))
 
     def warn(self, handler: str, message: str) -> None:
-        self._do_log(f"⚠️️ [{handler}] {message}")
+        self._put(self._format(self._WARN, handler, message))
 
     def error(self, handler: str, message: str) -> None:
-        self._do_log(f"❌️️ [{handler}] {message}")
+        self._put(self._format(self._ERROR, handler, message))
 
     def fatal(self, handler: str, message: str) -> None:
-        self._do_log(f"⛔ [{handler}] {message}")
+        # The process is about to exit, so write synchronously rather than leaving it to the daemon thread. The write
+        # lock makes sure anything the thread is writing goes out first.
+        with self._write_lock:
+            lines = self._pending()
+            lines.append(self._format(self._FATAL, handler, message))
+            self._flush(lines)
         exit(1)
 
-    def set_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+    def set_loop(self, loop: "asyncio.AbstractEventLoop") -> None:
         # Unneeded for this logger.
         pass
@@ -1,5 +1,15 @@
 from .logger import AbstractLogger, DefaultLogger
 import asyncio
+import functools
+
+try:
+    import uvloop
+    uvloop.install()
+    _new_event_loop = uvloop.new_event_loop
+    _uvloop_available = True
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+    _uvloop_available = False
 
 
 class _BootstrappingMetadata(object):
@@ -21,40 +31,31 @@ class _BootstrappingMetadata(object):
             raise TypeError("Function ran after bootstrapping has ran. Functions here are only meant to be ran during "
                             "bootstrapping!")
 
-    @property
+    @functools.cached_property
     def logger(self) -> AbstractLogger:
         """Used to get the logger which used."""
-        try:
-            return self._logger
-        except AttributeError:
-            self._logger = DefaultLogger()
-            return self._logger
+        return DefaultLogger()
 
     def set_logger(self, logger: AbstractLogger) -> None:
         """Used to set the logger within an initializer."""
         self._throw_if_bootstrapped()
-        self._logger = logger
+        # Writes over the cached property value.
+        self.__dict__["logger"] = logger
 
-    @property
+    @functools.cached_property
     def loop(self) -> asyncio.AbstractEventLoop:
         """Used to get the event loop which is used."""
-        try:
-            return self._loop
-        except AttributeError:
-            try:
-                from uvloop import new_event_loop
-                self._loop = new_event_loop()
-            except ImportError:
-                self.logger.warn("rainbows.bootstrap", "uvloop is not available. If this is not a Windows system, "
-                                                       "install uvloop from pip for a free performance bump! The "
-                                                       "default Dockerfile already contains uvloop.")
-                self._loop = asyncio.get_event_loop()
-            return self._loop
+        if not _uvloop_available:
+            self.logger.warn("rainbows.bootstrap", "uvloop is not available. If this is not a Windows system, "
+                                                   "install uvloop from pip for a free performance bump! The "
+                                                   "default Dockerfile already contains uvloop.")
+        return _new_event_loop()
 
     def set_loop(self, loop: asyncio.AbstractEventLoop):
         """Used to set the event loop within an initializer."""
         self._throw_if_bootstrapped()
-        self._loop = loop
+        # Writes over the cached property value.
+        self.__dict__["loop"] = loop
 
     def _post_bootstrap(self):
         """Does all post bootstrap handling."""
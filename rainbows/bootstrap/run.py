@@ -1,58 +1,66 @@
 from .metadata import bootstrapping_metadata
 from rainbows.helpers import import_folder
 import os
-import ntpath
 import typing
 import stat
-import inspect
+import asyncio
 
 
-def partial_bootstrap(dirname: str) -> None:
-    """Partially bootstraps the application but does not actually listen."""
-    config_path = ntpath.join(dirname, "config")
-    if not ntpath.isdir(config_path):
+def _run_sync_initializers(dirname: str) -> typing.List[typing.Callable[[], typing.Awaitable[None]]]:
+    """Runs all of the sync initializers in order and returns the async initializers which still need to be ran."""
+    config_path = os.path.join(dirname, "config")
+    if not os.path.isdir(config_path):
         raise FileNotFoundError("The config folder is not found")
 
-    initializers_path = os.stat(ntpath.join(dirname, "initializers"))
-    if not stat.S_ISDIR(initializers_path.st_mode):
+    initializers_path = os.path.join(config_path, "initializers")
+    if not stat.S_ISDIR(os.stat(initializers_path).st_mode):
         raise IOError("The initializers path was a file instead of a folder.")
 
     def order_filepaths(l: typing.List[str]) -> typing.List[str]:
         """
-        Orders file paths in an order which will load initializers with "logger" in first, will load initializers with
-        "loop" in after, and then just load the rest in alphabetical order.
+        Orders file paths in an order which will load initializers with "logger" in the filename first, will load
+        initializers with "loop" in the filename after, and then just load the rest in alphabetical order.
         """
-        logger_related = []
-        loop_related = []
-        remainder = []
-        for item in l:
-            if "logger" in item:
-                logger_related.append(item)
-            elif "loop" in item:
-                loop_related.append(item)
-            else:
-                remainder.append(item)
-
-        logger_related.sort()
-        loop_related.sort()
-        remainder.sort()
+        def key(p: str) -> typing.Tuple[int, str]:
+            base = os.path.basename(p)
+            if "logger" in base:
+                return 0, p
+            if "loop" in base:
+                return 1, p
+            return 2, p
 
-        return logger_related + loop_related + remainder
+        return sorted(l, key=key)
 
     remaining_initializers = import_folder(initializers_path, None, order_filepaths, lambda _: "initializer")
     async_inits = []
+    is_coro = asyncio.iscoroutinefunction
     for value in remaining_initializers.values():
-        if inspect.iscoroutinefunction(value):
+        if is_coro(value):
             async_inits.append(value)
         else:
             value()
+    return async_inits
 
+
+async def _run_async_initializers(async_inits: typing.List[typing.Callable[[], typing.Awaitable[None]]]) -> None:
+    """Runs the async initializers. These are ordered, so they are ran one after another."""
     for initializer in async_inits:
-        bootstrapping_metadata.loop.run_until_complete(initializer())
+        await initializer()
+
 
+def partial_bootstrap(dirname: str) -> None:
+    """Partially bootstraps the application but does not actually listen."""
+    async_inits = _run_sync_initializers(dirname)
+    if async_inits:
+        bootstrapping_metadata.loop.run_until_complete(_run_async_initializers(async_inits))
     bootstrapping_metadata._post_bootstrap()
 
 
+async def _main(async_inits: typing.List[typing.Callable[[], typing.Awaitable[None]]]) -> None:
+    """The entrypoint ran on the event loop by run."""
+    await _run_async_initializers(async_inits)
+    bootstrapping_metadata._post_bootstrap()
+    # TODO
 
 
 def run(dirname: str) -> typing.NoReturn:
@@ -60,6 +68,20 @@ def run(dirname: str) -> typing.NoReturn:
     Used to bootstrap Rainbows and keep running it until CTRL+C is sent. This function expects Rainbows to be in the
     standard file/folder format of a regular install.
     """
-    partial_bootstrap(dirname)
+    # The sync initializers run first since they can change the loop. After that, everything runs within one runner
+    # on that loop, which handles CTRL+C and cleanly shuts the loop down like asyncio.run would.
+    async_inits = _run_sync_initializers(dirname)
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner(loop_factory=lambda: bootstrapping_metadata.loop) as runner:
+            runner.run(_main(async_inits))
+        return
+
+    # asyncio.Runner is only in Python 3.11+, so shut the loop down by hand on older versions.
     loop = bootstrapping_metadata.loop
-    # TODO
+    try:
+        loop.run_until_complete(_main(async_inits))
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
@@ -1,9 +1,13 @@
-import asyncio
 import typing
 
+if typing.TYPE_CHECKING:
+    import asyncio
+
 
 class Context(object):
-    def __init__(self, loop: asyncio.AbstractEventLoop):
+    __slots__ = ("_autoclose_records", "loop")
+
+    def __init__(self, loop: "asyncio.AbstractEventLoop"):
         self._autoclose_records = []
         self.loop = loop
 
@@ -18,9 +22,3 @@ class Context(object):
         not, they will stay alive and cause a connection leak.
         """
         self._autoclose_records = None
-
-    def _autoclose_record(self, fn):
-        """This is a magic function used by record iterators to auto-close record iterators at the end of a request."""
-        if self._autoclose_records is None:
-            return
-        self._autoclose_records.append(fn)
@@ -1,14 +1,18 @@
 import abc
-import asyncio
 import typing
 from rainbows.model.model import Model
 
+if typing.TYPE_CHECKING:
+    import asyncio
+
 
 class AbstractRecordIterator(abc.ABC):
     """This should be inherited by the database driver to create a new iterator."""
     def _rainbows_autoclose(self, ctx):
         """Internal - do not edit. Handles Rainbows magic like auto-closing record iterators."""
-        ctx._autoclose_record(self.close)
+        records = ctx._autoclose_records
+        if records is not None:
+            records.append(self.close)
 
     @abc.abstractmethod
     async def close(self) -> None:
@@ -56,7 +60,7 @@ class AbstractDatabaseDriver(abc.ABC):
 
     @staticmethod
     @abc.abstractmethod
-    async def bootstrap(config: typing.Dict[str, typing.Any], loop: asyncio.AbstractEventLoop) -> typing.Any:
+    async def bootstrap(config: typing.Dict[str, typing.Any], loop: "asyncio.AbstractEventLoop") -> typing.Any:
         """
         Bootstraps the driver. Can return any exceptions the driver thinks is appropriate, but if this is at boot,
         throwing here will result in the application crashing. The config parameter is fetched by taking the config
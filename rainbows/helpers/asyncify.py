@@ -1,12 +1,40 @@
-import inspect
+import asyncio
+import functools
+import types
+import typing
+
+
+async def _call_sync(fn, *args, **kwargs):
+    """The shared coroutine function used to call a sync function from asyncify."""
+    return fn(*args, **kwargs)
 
 
 def asyncify(fn):
     """This function exists to take a function that may or may not be async and ensure that the function is."""
-    if inspect.iscoroutinefunction(fn):
+    if asyncio.iscoroutinefunction(fn):
         return fn
 
-    async def wrap(*args, **kwargs):
-        return fn(*args, **kwargs)
+    # Plain functions get their wrapper stashed on them so repeat calls are just an attribute lookup. Bound methods
+    # proxy attribute reads to their underlying function, so they are always wrapped fresh. functools.wraps copies
+    # __dict__ onto the wrapping function, so the stashed wrapper is only reused if it actually wraps this function.
+    is_function = type(fn) is types.FunctionType
+    if is_function:
+        cached = fn.__dict__.get("__rainbows_async__")
+        if cached is not None and cached.args[0] is fn:
+            return cached
 
+    wrap = functools.partial(_call_sync, fn)
+    if is_function:
+        fn.__rainbows_async__ = wrap
     return wrap
+
+
+def _direct(fn: typing.Callable) -> typing.Tuple[bool, typing.Callable]:
+    """
+    Returns a tuple of if the function is async and the function itself. This is useful for hot paths where the caller
+    can branch on the result and call sync functions without creating a coroutine.
+    """
+    return asyncio.iscoroutinefunction(fn), fn
+
+
+asyncify.direct = _direct
@@ -6,12 +6,16 @@ class ChainProxy(object):
     def __init__(self, obj):
         self._obj = obj
 
-    def __getattribute__(self, item):
-        root = object.__getattribute__(self, "_obj")
-        _undefined = {}
-        res = getattr(root, item, _undefined)
-        if res is _undefined:
-            raise AttributeError(f"{type(root)} does not contain {item}")
+    def __getattr__(self, item):
+        # Only called on misses, so _obj normally resolves without getting here. If it is missing (for example, on a
+        # copy which has not been initialised), do not recurse looking for it.
+        if item == "_obj":
+            raise AttributeError(item)
+
+        try:
+            res = getattr(self._obj, item)
+        except AttributeError as e:
+            raise AttributeError(f"{type(self._obj)} does not contain {item}") from e
 
         def self_returning_caller(*args, **kwargs):
             res(*args, **kwargs)
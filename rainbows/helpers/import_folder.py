@@ -1,13 +1,39 @@
-import importlib
+import importlib.util
 import os
-import ntpath
+import sys
 import typing
 
 
+# The prefix used for the names of modules loaded by import_folder in sys.modules.
+_MODULE_PREFIX = "rainbows_dyn."
+
+
 class ImportDisallowedError(Exception):
     """Thrown by the validate_filepath function if a filepath is disallowed."""
 
 
+def _load_module(fp: str) -> typing.Any:
+    """
+    Loads the module at the filepath directly, re-using it if it was already loaded. The module name is based on the
+    absolute path so that files with the same name in different folders do not collide.
+    """
+    path = os.path.splitdrive(os.path.abspath(fp))[1][:-3]
+    module_name = _MODULE_PREFIX + path.strip(os.sep).replace(os.sep, ".")
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, fp)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
 def import_folder(
         fp: str, validate_filepath: typing.Union[typing.Callable[[str], typing.Union[str, None]], None],
         order_filepaths: typing.Union[typing.Callable[[typing.List[str]], typing.List[str]], None],
@@ -37,35 +63,31 @@ def import_folder(
     sub_part = {}
     file_result = {}
 
-    def _process_folder(files):
-        for file in files:
-            if ntpath.isdir(file):
-                # This is a folder, give it to the processor.
-                fps = os.listdir(file)
-                for index, filename in enumerate(fps):
-                    fps[index] = ntpath.join(file, filename)
-                _process_folder(fps)
-            else:
-                # This is a file, process it.
-                try:
-                    # Do the default handling.
-                    filename = ntpath.basename(file)
-                    if not filename.endswith(".py") or filename.startswith("_"):
-                        raise ImportDisallowedError
-
-                    # Call the validate function.
-                    if validate_filepath is None:
-                        sub_part[file] = None
-                    else:
-                        sub_part[file] = validate_filepath(file)
-                except ImportDisallowedError:
+    # Walk the folders with an explicit stack rather than recursing.
+    stack = [fp]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    # This is a folder, process it later.
+                    stack.append(entry.path)
+                    continue
+
+                # This is a file, do the default handling.
+                filename = entry.name
+                if not filename.endswith(".py") or filename.startswith("_"):
                     continue
-                allowed_paths.append(file)
 
-    fps = os.listdir(fp)
-    for index, filename in enumerate(fps):
-        fps[index] = ntpath.join(fp, filename)
-    _process_folder(fps)
+                # Call the validate function.
+                file = entry.path
+                if validate_filepath is None:
+                    sub_part[file] = None
+                else:
+                    try:
+                        sub_part[file] = validate_filepath(file)
+                    except ImportDisallowedError:
+                        continue
+                allowed_paths.append(file)
 
     if order_filepaths is not None:
         allowed_paths = order_filepaths(allowed_paths)
@@ -73,17 +95,13 @@ def import_folder(
     undefined = {}
     for fp in allowed_paths:
         imports = look_for_imports(sub_part[fp])
-        module = importlib.import_module(fp)
+        module_dict = vars(_load_module(fp))
         if type(imports) is str:
-            a = getattr(module, imports, undefined)
+            a = module_dict.get(imports, undefined)
             if a is not undefined:
                 file_result[fp] = a
         elif imports is not None:
-            results = []
-            for i in imports:
-                a = getattr(module, i, undefined)
-                if a is not undefined:
-                    results.append(a)
+            results = [module_dict[i] for i in imports if i in module_dict]
             if len(results) != 0:
                 file_result[fp] = results
 
@@ -10,3 +10,7 @@ class ValidationError(Exception):
     @property
     def key_name(self):
         return self._key_name
+
+    @key_name.setter
+    def key_name(self, value: str):
+        self._key_name = value
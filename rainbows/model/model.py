@@ -1,8 +1,10 @@
+import functools
 import inspect
+import sys
+import types
 import typing
 from .exceptions import ValidationError
-from .builtin_validators import BUILT_IN_VALIDATORS
-from rainbows.helpers import asyncify
+from .builtin_validators import FAST_BUILT_IN_VALIDATORS
 
 
 VALIDATOR_CALLABLE = typing.Union[
@@ -32,107 +34,300 @@ def validates(key_name: typing.Union[str, typing.List[str], None] = None) -> typ
     return deco
 
 
-async def _validate_attr(type_: typing.Any, item: typing.Any, key: str) -> typing.Any:
-    """Validates that an attribute matches the type specified."""
+def _arg_count(fn: typing.Callable) -> int:
+    """
+    Gets the number of positional arguments a callable takes. This reads the code object directly since building a
+    signature is expensive, and only falls back to inspect.signature for callables without one or with variable or
+    keyword-only arguments.
+    """
+    bound = 0
+    func = fn
+    while True:
+        if isinstance(func, functools.partial):
+            bound += len(func.args)
+            func = func.func
+        elif isinstance(func, types.MethodType):
+            bound += 1
+            func = func.__func__
+        else:
+            break
+
+    # Follow functools.wraps so decorated validators are counted by the function they wrap, like inspect.signature.
+    func = inspect.unwrap(func)
+    code = getattr(func, "__code__", None)
+    if code is None or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS) or code.co_kwonlyargcount:
+        return len(inspect.signature(fn).parameters)
+    return code.co_argcount - bound
+
+
+def _is_optional(type_: typing.Any) -> bool:
+    """Checks if the type is typing.Optional (a union including None)."""
+    return typing.get_origin(type_) is typing.Union and type(None) in typing.get_args(type_)
+
+
+# Used to tell a missing key apart from a key set to None.
+_MISSING = object()
+
+_ATTR_VALIDATOR = typing.Callable[[str, typing.Any], typing.Any]
+
+# How a compiled validator uses the key it is given. Containers only build the key of each element for validators
+# which use it, since building it for every element is a large part of the cost of validating a container.
+_KEY_UNUSED = 0
+_KEY_IN_ERROR = 1
+_KEY_USED = 2
+
+_COMPILED_VALIDATOR = typing.Tuple[_ATTR_VALIDATOR, bool, int]
+
+
+# Containers of built-in types at least this long check the types of all elements in one pass in C before validating
+# them. Below this, building the set of types costs more than it saves.
+_FAST_PATH_MIN_LEN = 8
+
+
+def _element_error(
+    e: ValidationError, validator: _ATTR_VALIDATOR, key_mode: int, element_key: str, value: typing.Any,
+) -> ValidationError:
+    """
+    Gets the error to raise when an element validator which was given the key of the container fails. Validators which
+    only use the key in their errors are pure, so they are ran again with the key of the element to get the right
+    message. Otherwise, the original error is pointed at the element.
+    """
+    if key_mode == _KEY_IN_ERROR:
+        try:
+            validator(element_key, value)
+        except ValidationError as element_error:
+            return element_error
+    e.key_name = element_key
+    return e
+
+
+# Maps id(type) to (type, compiled validator). This is keyed on identity rather than equality since typing treats
+# unions as unordered (Union[int, str] == Union[str, int]), but the order decides which member is tried first. The
+# type is kept in the value so that its ID cannot be reused by another object.
+_VALIDATOR_CACHE: typing.Dict[int, typing.Tuple[typing.Any, _COMPILED_VALIDATOR]] = {}
+
+
+def _compile_validator(type_: typing.Any) -> _COMPILED_VALIDATOR:
+    """Gets the compiled validator for the type, building it if it has not been built yet."""
+    cached = _VALIDATOR_CACHE.get(id(type_))
+    if cached is not None and cached[0] is type_:
+        return cached[1]
+    compiled = _build_validator(type_)
+    _VALIDATOR_CACHE[id(type_)] = (type_, compiled)
+    return compiled
+
+
+def _compile_union_member(type_: typing.Any) -> _COMPILED_VALIDATOR:
+    """
+    Compiles the validator for a member of a union. If the member cannot be validated, the error is only raised when
+    the member is tried, so that values which an earlier member accepts still validate.
+    """
+    try:
+        return _compile_validator(type_)
+    except TypeError as e:
+        message = str(e)
+
+        def unsupported(_, __):
+            raise TypeError(message)
+
+        return unsupported, False, _KEY_IN_ERROR
+
+
+def _build_validator(type_: typing.Any) -> _COMPILED_VALIDATOR:
+    """
+    Builds a function which validates that an attribute matches the type specified. All of the type introspection
+    happens here once per type, so the returned function only has to do the validation itself. The result is a tuple
+    of the function, if it is async and how it uses the key (one of the _KEY_* constants). The function takes the key
+    and then the value, like the built-in validators, so that built-in types use the (fast) built-in validator
+    directly and checking each element of a container does not create a coroutine or an extra frame.
+    """
+    # Handle any types.
+    if type_ is typing.Any:
+        def any_validator(_, item):
+            return item
+
+        return any_validator, False, _KEY_UNUSED
+
     typing_origin = typing.get_origin(type_)
+    type_args = typing.get_args(type_)
     if typing_origin is None:
         # This isn't typing magic, this is a normal type.
-        try:
-            builtin_validator = BUILT_IN_VALIDATORS[type_]
-
-            async def validator(value, key):
-                return builtin_validator(key, value)
-        except KeyError:
-            # Check if there is a custom validator on the type.
-            validator_attr = getattr(type_, "__validate__", None)
-            if validator_attr is None:
-                validator = None
+        builtin_validator = FAST_BUILT_IN_VALIDATORS.get(type_)
+        if builtin_validator is not None:
+            return builtin_validator, False, _KEY_IN_ERROR
+
+        # Check if there is a custom validator on the type.
+        validator_attr = getattr(type_, "__validate__", None)
+        if validator_attr is None:
+            raise TypeError(f"The type parameter {type_} does not have __validate__ and is not a recognised "
+                            "built-in type")
+
+        is_coro = inspect.iscoroutinefunction(validator_attr)
+        if _arg_count(validator_attr) == 1:
+            if is_coro:
+                async def custom(_, a):
+                    return await validator_attr(a)
             else:
-                sig = inspect.signature(validator_attr)
-                if len(sig.parameters) == 1:
-                    if inspect.iscoroutinefunction(validator_attr):
-                        async def two_params(a, _):
-                            return await validator_attr(a)
-
-                        validator = two_params
-                    else:
-                        def two_params(a, _):
-                            return validator_attr(a)
-
-                        validator = two_params
-                else:
-                    validator = validator_attr
-                validator = asyncify(validator)
-
-        # Call the validator function.
-        if validator:
-            return await validator(item, key)
-        raise TypeError(f"The type parameter for {key} does not have "
-                        "__validate__ and is not a recognised built-in type")
+                def custom(_, a):
+                    return validator_attr(a)
+            return custom, is_coro, _KEY_UNUSED
 
-    # Handle any types.
-    if typing_origin is typing.Any:
-        return item
+        if is_coro:
+            async def custom(key, a):
+                return await validator_attr(a, key)
+        else:
+            def custom(key, a):
+                return validator_attr(a, key)
+        return custom, is_coro, _KEY_USED
 
     # Handle unions.
     if typing_origin is typing.Union:
-        types = typing.get_args(type_)
-        if item is None and None in types:
-            # Fast path!
-            return None
-        _undefined = {}
-        last_throw = _undefined
-        for type_ in types:
-            if type_ is not None:
+        allows_none = type(None) in type_args
+        validators = tuple(_compile_union_member(t) for t in type_args if t is not type(None))
+        if not validators:
+            raise TypeError(f"Union {type_} was empty")
+
+        if allows_none and len(validators) == 1:
+            # This is typing.Optional, which is the most common union, so it gets its own path.
+            inner_validator, is_async, key_mode = validators[0]
+            if is_async:
+                async def optional(key, item):
+                    if item is None:
+                        return None
+                    return await inner_validator(key, item)
+            else:
+                def optional(key, item):
+                    if item is None:
+                        return None
+                    return inner_validator(key, item)
+            return optional, is_async, key_mode
+
+        async def union(key, item):
+            if item is None and allows_none:
+                # Fast path!
+                return None
+            last_throw = None
+            for validator, is_async, _ in validators:
                 try:
-                    return await _validate_attr(type_, item, key)
+                    if is_async:
+                        return await validator(key, item)
+                    return validator(key, item)
                 except (TypeError, ValidationError) as e:
                     last_throw = e
-        if last_throw is not _undefined:
             raise last_throw from last_throw
-        raise TypeError(f"Union for key {key} was empty")
+
+        # The union is async, so it is never ran again to rebuild an error. If no member uses the key, the error can
+        # still be pointed at the element afterwards.
+        if all(key_mode == _KEY_UNUSED for _, _, key_mode in validators):
+            return union, True, _KEY_UNUSED
+        return union, True, _KEY_USED
 
     # Handle dicts.
-    if typing_origin is typing.Dict:
-        types = typing.get_args(type_)
-        if len(types) != 2:
-            raise TypeError(f"Unknown dict type count for {key}: {types}")
-        dict_key_type = types[0]
-        dict_value_type = types[1]
-        if not isinstance(item, dict):
-            raise ValidationError(f"The key {key} is not of a dict type", key)
-        for dict_key, value in item.items():
-            value = await _validate_attr(dict_value_type, value, f"{key}['{dict_key}']")
-            new_key = await _validate_attr(dict_key_type, dict_key, f"{key}['{dict_key}']")
-            if new_key is not dict_key:
-                del item[dict_key]
-            item[new_key] = value
-        return item
+    if typing_origin is dict:
+        if len(type_args) != 2:
+            raise TypeError(f"Unknown dict type count for {type_}: {type_args}")
+        dict_key_validator, key_is_async, key_key_mode = _compile_validator(type_args[0])
+        dict_value_validator, value_is_async, value_key_mode = _compile_validator(type_args[1])
+        key_takes_key = key_key_mode == _KEY_USED
+        value_takes_key = value_key_mode == _KEY_USED
+
+        async def dict_validator(key, item):
+            if not isinstance(item, dict):
+                raise ValidationError(f"The key {key} is not of a dict type", key)
+            # A new dict is built since key validators can return different keys, and changing the keys of the dict
+            # whilst iterating through it would raise.
+            result = {}
+            for dict_key, value in item.items():
+                try:
+                    new_value = dict_value_validator(f"{key}['{dict_key}']" if value_takes_key else key, value)
+                    if value_is_async:
+                        new_value = await new_value
+                except ValidationError as e:
+                    if value_takes_key:
+                        raise
+                    raise _element_error(e, dict_value_validator, value_key_mode, f"{key}['{dict_key}']", value)
+                try:
+                    new_key = dict_key_validator(f"{key}['{dict_key}']" if key_takes_key else key, dict_key)
+                    if key_is_async:
+                        new_key = await new_key
+                except ValidationError as e:
+                    if key_takes_key:
+                        raise
+                    raise _element_error(e, dict_key_validator, key_key_mode, f"{key}['{dict_key}']", dict_key)
+                result[new_key] = new_value
+            return result
+
+        return dict_validator, True, _KEY_USED
 
     # Handle lists.
-    if typing_origin is typing.List:
-        type_ = typing.get_args(type_)[0]
-        if not isinstance(item, list):
-            if isinstance(item, set):
-                # Close enough to safely convert.
-                item = list(item)
+    if typing_origin is list:
+        if len(type_args) != 1:
+            raise TypeError(f"Unknown list type count for {type_}: {type_args}")
+        list_validator, is_async, key_mode = _compile_validator(type_args[0])
+        takes_key = key_mode == _KEY_USED
+        exact_type = type_args[0] if type_args[0] in FAST_BUILT_IN_VALIDATORS else None
+
+        async def list_validator_wrapper(key, item):
+            if not isinstance(item, list):
+                if isinstance(item, set):
+                    # Close enough to safely convert.
+                    item = list(item)
+                else:
+                    raise ValidationError(f"The key {key} is not of a list type", key)
+            if exact_type is not None and len(item) >= _FAST_PATH_MIN_LEN and set(map(type, item)) == {exact_type}:
+                # Fast path! Everything is already the right type.
+                return item
+            if is_async:
+                for index in range(len(item)):
+                    try:
+                        item[index] = await list_validator(f"{key}[{index}]" if takes_key else key, item[index])
+                    except ValidationError as e:
+                        if takes_key:
+                            raise
+                        raise _element_error(e, list_validator, key_mode, f"{key}[{index}]", item[index])
             else:
-                raise ValidationError(f"The key {key} is not of a list type", key)
-        for index, list_obj in enumerate(item):
-            item[index] = await _validate_attr(type_, list_obj, f"{key}[{index}]")
-        return item
+                for index in range(len(item)):
+                    try:
+                        item[index] = list_validator(f"{key}[{index}]" if takes_key else key, item[index])
+                    except ValidationError as e:
+                        if takes_key:
+                            raise
+                        raise _element_error(e, list_validator, key_mode, f"{key}[{index}]", item[index])
+            return item
+
+        return list_validator_wrapper, True, _KEY_USED
 
     # Handle sets.
-    if typing_origin is typing.Set:
-        type_ = typing.get_args(type_)[0]
-        if not isinstance(item, (set, list)):
-            raise ValidationError(f"The key {key} is not of a set or list type", key)
-        s = set()
-        for index, obj in enumerate(item):
-            s.add(await _validate_attr(type_, obj, f"{key}[{index}]"))
-        return s
+    if typing_origin is set:
+        if len(type_args) != 1:
+            raise TypeError(f"Unknown set type count for {type_}: {type_args}")
+        set_validator, is_async, key_mode = _compile_validator(type_args[0])
+        takes_key = key_mode == _KEY_USED
+        exact_type = type_args[0] if type_args[0] in FAST_BUILT_IN_VALIDATORS else None
+
+        async def set_validator_wrapper(key, item):
+            if not isinstance(item, (set, list)):
+                raise ValidationError(f"The key {key} is not of a set or list type", key)
+            if exact_type is not None and type(item) is set and len(item) >= _FAST_PATH_MIN_LEN and \
+                    set(map(type, item)) == {exact_type}:
+                # Fast path! Everything is already the right type.
+                return item
+            s = set()
+            for index, obj in enumerate(item):
+                try:
+                    value = set_validator(f"{key}[{index}]" if takes_key else key, obj)
+                    if is_async:
+                        value = await value
+                except ValidationError as e:
+                    if takes_key:
+                        raise
+                    raise _element_error(e, set_validator, key_mode, f"{key}[{index}]", obj)
+                s.add(value)
+            return s
+
+        return set_validator_wrapper, True, _KEY_USED
 
-    raise TypeError(f"Unsupported typing type used by key {key}: {typing_origin}")
+    raise TypeError(f"Unsupported typing type used by {type_}: {typing_origin}")
 
 
 class Model(object):
@@ -160,44 +355,86 @@ class Model(object):
            class what the model handles.
     """
 
+    __slots__ = ("__dict__", "_items", "_defaults", "_default_keys", "_attributes", "_validators", "_ignored_attrs")
+
+    # These are set per class by __init_subclass__.
+    _validator_specs: typing.Tuple[typing.Tuple[typing.Any, str, bool, bool], ...] = ()
+    _cleaned_attributes: typing.Dict[str, typing.Any] = {}
+    _attribute_keys: typing.FrozenSet[str] = frozenset()
+    _default_specs: typing.Dict[str, typing.Tuple[typing.Any, typing.Optional[typing.Callable]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Works out everything about the model which does not depend on the instance when the class is created, so
+        that initialising a model only has to do the per-instance work.
+        """
+        super().__init_subclass__(**kwargs)
+
+        # Resolve the type hints (including string annotations and those of parent classes) once. If a forward
+        # reference cannot be resolved yet, fall back to the raw annotations.
+        try:
+            hints = typing.get_type_hints(cls)
+        except NameError:
+            hints = {}
+            for parent in reversed(cls.__mro__):
+                hints.update(parent.__dict__.get("__annotations__", {}))
+        cls._cleaned_attributes = {sys.intern(k): v for k, v in hints.items() if not k.startswith("_")}
+        cls._attribute_keys = frozenset(cls._cleaned_attributes)
+
+        # Move defaults off the class so that attribute access goes through the model. Defaults from parent classes
+        # were already moved by their own __init_subclass__.
+        default_specs = dict(cls._default_specs)
+        for attr_name in cls._cleaned_attributes:
+            if attr_name in cls.__dict__:
+                item = cls.__dict__[attr_name]
+                delattr(cls, attr_name)
+                default_specs[attr_name] = (item, getattr(item, "_rainbows_default", None))
+        cls._default_specs = default_specs
+
+        # Find the methods tagged with the validates decorator and work out how they should be called.
+        _undefined = {}
+        validator_specs = []
+        for attr_name in dir(cls):
+            attr = getattr(cls, attr_name, None)
+            validates_keys = getattr(attr, "_validates_keys", _undefined)
+            if validates_keys is _undefined:
+                continue
+            arg_count = _arg_count(attr)
+            if isinstance(inspect.getattr_static(cls, attr_name), types.FunctionType):
+                # This will be bound to the instance, so self is not passed by the caller.
+                arg_count -= 1
+            validator_specs.append(
+                (validates_keys, attr_name, arg_count != 1, inspect.iscoroutinefunction(attr)))
+        cls._validator_specs = tuple(validator_specs)
+
     def __init__(self, **kwargs):
         """
         Used to initialise the class and any attributes that you wish to set at the start via the kwargs. Note that
         this does NOT actually validate them, it just sets them ready to be validated.
         """
+        cls = type(self)
         self._defaults = {}
+        self._default_keys = set()
+        self._validators = {}
+        self._ignored_attrs = set()
 
-        for key in kwargs:
-            if key.startswith("_"):
-                del kwargs[key]
-        self._items = kwargs
+        self._items = {k: v for k, v in kwargs.items() if not k.startswith("_")}
 
-        _undefined = {}
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            validates_keys = getattr(attr, "_validates_keys", _undefined)
-            if validates_keys is not _undefined:
-                self.add_validator(validates_keys, attr)
+        for validates_keys, attr_name, takes_key, is_coro in cls._validator_specs:
+            self._register_validator(validates_keys, getattr(self, attr_name), takes_key, is_coro)
 
-        self._attributes = getattr(self, "__annotations__", {})
-        for attr_name in self._attributes:
-            if attr_name.startswith("_"):
-                del self._attributes[attr_name]
-                continue
+        self._attributes = cls._cleaned_attributes
+        for attr_name, (item, rainbows_default) in cls._default_specs.items():
+            if rainbows_default is not None:
+                item = rainbows_default(self)
+            self._defaults[attr_name] = item
 
-            found = False
-            try:
-                item = object.__getattribute__(self, attr_name)
-                object.__delattr__(self, attr_name)
-                found = True
-            except AttributeError:
-                pass
-
-            if found:
-                rainbows_default = getattr(item, "_rainbows_default", None)
-                if rainbows_default is not None:
-                    item = rainbows_default(self)
-                self._defaults[attr_name] = item
+        # Defaults are put in the items so that reads only need one lookup. _default_keys tracks which are defaults.
+        items = self._items
+        for attr_name, item in self._defaults.items():
+            if attr_name not in items:
+                items[attr_name] = item
+                self._default_keys.add(attr_name)
 
     def attributes(self) -> typing.Dict[str, typing.Any]:
         """
@@ -211,73 +448,71 @@ class Model(object):
         """
         Defines if a key will use its default value. This is false if there is no default or if the key is present.
         """
-        if key in self._items:
-            return False
-
-        return key in self._defaults
+        return key in self._default_keys
 
     def __eq__(self, other) -> bool:
         """Check if 2 models are equal in type and content."""
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return False
-        other_items = other._items
-        for key, value in self._items.items():
-            if key not in other_items or value != other_items[key]:
-                return False
-        return True
+        return self._items == other._items
 
     def __ne__(self, other) -> bool:
         """Returns not __eq__."""
         return not self.__eq__(other)
 
+    def _unset_item(self, key) -> bool:
+        """Removes a set item, going back to the default if there is one. Returns False if it was not set."""
+        if key not in self._items or key in self._default_keys:
+            return False
+        if key in self._defaults:
+            self._items[key] = self._defaults[key]
+            self._default_keys.add(key)
+        else:
+            del self._items[key]
+        return True
+
     def __delattr__(self, item):
         """Allows you to delete an item by attribute."""
-        try:
+        if item[0] == "_" or item in self.__dict__:
             object.__delattr__(self, item)
-        except AttributeError as e:
-            try:
-                del self._items[item]
-            except KeyError:
-                raise e from e
+        elif not self._unset_item(item):
+            raise AttributeError(f"The attribute '{item}' is not present on this model object.")
 
     def __delitem__(self, key):
         """Allows you to delete an item by key."""
-        del self._items[key]
+        if not self._unset_item(key):
+            raise KeyError(key)
 
     def __contains__(self, item):
         """Check if it is contained in our internal items."""
-        return item in self._items
+        return item in self._items and item not in self._default_keys
 
     def __getitem__(self, item):
         """Gets the item from the internal items dict."""
-        try:
-            return self._items[item]
-        except KeyError as e:
-            if item in self._defaults:
-                return self._defaults[item]
-            raise e from e
+        return self._items[item]
 
     def __setitem__(self, key, value):
         """Sets an item in the internal items dict."""
         if key.startswith("_"):
             raise ValueError("Key cannot start with an underscore")
+        key = sys.intern(key)
         self._items[key] = value
+        self._default_keys.discard(key)
 
     def __getattr__(self, name):
         """Gets the attribute if it isn't found in the main object."""
-        try:
-            return self._items[name]
-        except KeyError as e:
-            if name in self._defaults:
-                return self._defaults[name]
-            raise AttributeError(f"The attribute '{name}' is not present on this model object.") from e
+        value = self._items.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"The attribute '{name}' is not present on this model object.")
+        return value
 
     def __setattr__(self, key, value):
         """Sets the attribute to either the items dict or to the main object."""
-        if key.startswith("_") or key in getattr(self, "_ignored_attrs", []):
+        if key[0] == "_" or key in self._ignored_attrs:
             return object.__setattr__(self, key, value)
 
         self._items[key] = value
+        self._default_keys.discard(key)
 
     def add_validator(self, key_name: typing.Union[str, typing.List[str], None], handler: VALIDATOR_CALLABLE) -> None:
         """
@@ -289,14 +524,17 @@ class Model(object):
         :param handler:  The handler is a (async) function which takes in either 1 argument (the value) or
                          2 arguments (the value and the key).
         """
-        validators = getattr(self, "_validators", None)
-        if validators is None:
-            validators = {}
-            self._validators = validators
-
-        sig = inspect.signature(handler)
-        if len(sig.parameters) == 1:
-            if inspect.iscoroutinefunction(handler):
+        self._register_validator(key_name, handler, _arg_count(handler) != 1, inspect.iscoroutinefunction(handler))
+
+    def _register_validator(
+            self, key_name: typing.Union[str, typing.List[str], None], handler: VALIDATOR_CALLABLE,
+            takes_key: bool, is_coro: bool,
+    ) -> None:
+        """Registers a validator where the argument count and if it is async have already been worked out."""
+        validators = self._validators
+
+        if not takes_key:
+            if is_coro:
                 old_handler = handler
 
                 async def two_params(a, _):
@@ -310,8 +548,9 @@ class Model(object):
                     return old_handler(a)
 
                 handler = two_params
-        handler = asyncify(handler)
 
+        # Sync handlers are stored as they are and called inline by validate, rather than being wrapped in a coroutine.
+        entry = (handler, is_coro)
         if key_name is None:
             keys = [None]
         elif isinstance(key_name, str):
@@ -321,9 +560,9 @@ class Model(object):
 
         for k in keys:
             try:
-                validators[k].append(handler)
+                validators[k].append(entry)
             except KeyError:
-                validators[k] = [handler]
+                validators[k] = [entry]
 
     def ignore_attribute(self, key: str) -> None:
         """
@@ -332,19 +571,35 @@ class Model(object):
 
         :param key: The attribute name you wish to ignore.
         """
-        ignored = getattr(self, "_ignored_attrs", None)
-        if ignored is None:
-            ignored = []
-            self._ignored_attrs = ignored
-
-        if key in self._defaults:
-            del self._defaults[key]
+        self._ignored_attrs.add(key)
 
-        if key in self._items:
-            setattr(self, key, self._items[key])
+        # The default has been moved off the class, so it is put on the instance to still be read as an attribute.
+        default = self._defaults.pop(key, _MISSING)
+        if key in self._default_keys:
+            self._default_keys.discard(key)
             del self._items[key]
+            object.__setattr__(self, key, default)
+        elif key in self._items:
+            object.__setattr__(self, key, self._items.pop(key))
 
-        ignored.append(key)
+    def _compiled_attributes(self) -> typing.Tuple[typing.Tuple[str, _ATTR_VALIDATOR, bool, bool], ...]:
+        """
+        Gets a tuple of (key, validator, is async, is optional) for each attribute. This is built once per model class
+        and then stored on the class, so validate is a straight loop over precompiled validators.
+        """
+        cls = type(self)
+        compiled = cls.__dict__.get("_rainbows_compiled_attributes")
+        if compiled is None:
+            compiled = []
+            for key, type_ in self._attributes.items():
+                try:
+                    validator, is_async, _ = _compile_validator(type_)
+                except TypeError as e:
+                    raise TypeError(f"Unable to validate key {key}: {e}") from e
+                compiled.append((key, validator, is_async, _is_optional(type_)))
+            compiled = tuple(compiled)
+            cls._rainbows_compiled_attributes = compiled
+        return compiled
 
     async def validate(self) -> typing.Dict[str, typing.Any]:
         """
@@ -352,50 +607,42 @@ class Model(object):
 
         :return: A dict with all the contents inside, using the default if it can when a value is not specified.
         """
-        for key in self._items:
-            if key not in self._attributes:
-                raise ValidationError(f"Key {key} has been added to the model contents, but is not in the schema", key)
-
-        all_items = self._items.copy()
-        for key, value in self._attributes.items():
-            # Handle if an attribute is present but not added.
-            if key not in all_items:
-                if key in self._defaults:
-                    # Attempt to get from defaults.
-                    value = self._defaults[key]
-                    all_items[key] = value
-                else:
-                    # Check if it is typing.Optional.
-                    is_optional = typing.get_origin(value) is typing.Union and type(None) in typing.get_args(value)
-                    if is_optional:
-                        all_items[key] = None
-                        continue
-                    raise ValidationError(f"Key {key} is not optional and was not found in the models contents", key)
+        items = self._items
+        attribute_keys = type(self)._attribute_keys
+        if not attribute_keys.issuperset(items):
+            for key in items:
+                if key not in attribute_keys:
+                    raise ValidationError(
+                        f"Key {key} has been added to the model contents, but is not in the schema", key)
+
+        for key, validator, is_async, is_optional in self._compiled_attributes():
+            value = items.get(key, _MISSING)
+
+            # Handle if an attribute is present but not added. Defaults are already in the items.
+            if value is _MISSING:
+                if is_optional:
+                    items[key] = None
+                    continue
+                raise ValidationError(f"Key {key} is not optional and was not found in the models contents", key)
 
             # Type check the specified param.
-            item_value = await _validate_attr(value, all_items[key], key)
-            all_items[key] = item_value
-            self._items[key] = item_value
+            value = validator(key, value)
+            if is_async:
+                value = await value
+            items[key] = value
 
-        custom_validators = getattr(self, "_validators", None)
+        custom_validators = self._validators
         if custom_validators:
-            async def call_validators(value, key):
-                try:
-                    handlers = custom_validators[key]
-                except KeyError:
-                    return
-                for h in handlers:
-                    value = await h(value, key)
-                return value
-
-            all_gobbler = []
-            if None in custom_validators:
-                all_gobbler = custom_validators[None]
-            for key, value in all_items.items():
-                for h in all_gobbler:
-                    value = await h(value, key)
-                value = await call_validators(value, key)
-                all_items[key] = value
-                self._items[key] = value
-
-        return all_items
+            all_gobbler = custom_validators.get(None, ())
+            for key, value in items.items():
+                for h, is_async in all_gobbler:
+                    value = h(value, key)
+                    if is_async:
+                        value = await value
+                for h, is_async in custom_validators.get(key, ()):
+                    value = h(value, key)
+                    if is_async:
+                        value = await value
+                items[key] = value
+
+        return items.copy()
@@ -10,6 +10,16 @@ class Record(Model):
     """
     Record is based off Model and handles all the database logic for your application.
     """
+    def __init_subclass__(cls, **kwargs):
+        """Works out the normalised table name from the class name once, when the class is created."""
+        super().__init_subclass__(**kwargs)
+        table_name = SNAKE_REGEX.sub("_", cls.__name__).lower()
+        if table_name.endswith("s"):
+            table_name += "es"
+        else:
+            table_name += "s"
+        cls._table_name = table_name
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.ignore_attribute("table_name")
@@ -27,10 +37,4 @@ class Record(Model):
         if self_table_name is not _undefined:
             return str(self_table_name)
 
-        table_name = SNAKE_REGEX.sub("_", self.__name__).lower()
-        if table_name.endswith("s"):
-            table_name += "es"
-        else:
-            table_name += "s"
-
-        return table_name
+        return type(self)._table_name
@@ -1,3 +1,4 @@
+import functools
 import unittest
 from rainbows.helpers import asyncify
 
@@ -14,3 +15,29 @@ class AsyncifyTest(unittest.IsolatedAsyncioTestCase):
             return "my name " + name
         fn = asyncify(test_func)
         self.assertEqual(await fn("jeff"), "my name jeff")
+
+    async def test_sync_wrapper_reused(self):
+        def test_func(name):
+            return "my name " + name
+        self.assertIs(asyncify(test_func), asyncify(test_func))
+
+    async def test_direct(self):
+        async def async_func():
+            pass
+
+        def sync_func():
+            pass
+
+        self.assertEqual(asyncify.direct(async_func), (True, async_func))
+        self.assertEqual(asyncify.direct(sync_func), (False, sync_func))
+
+    async def test_wraps_not_shared(self):
+        def f():
+            return "f!"
+
+        @functools.wraps(f)
+        def g():
+            return "g!"
+
+        self.assertEqual(await asyncify(f)(), "f!")
+        self.assertEqual(await asyncify(g)(), "g!")
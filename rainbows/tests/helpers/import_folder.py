@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from rainbows.helpers import import_folder
+
+
+class ImportFolderTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self._dir.name, "initializers")
+        os.makedirs(os.path.join(self.root, "nested"))
+        files = {
+            "a.py": "initializer = 'a'\n",
+            "_ignored.py": "initializer = 'ignored'\n",
+            "readme.txt": "initializer = 'txt'\n",
+            os.path.join("nested", "b.py"): "initializer = 'b'\nother = 'c'\n",
+        }
+        for name, content in files.items():
+            with open(os.path.join(self.root, name), "w") as f:
+                f.write(content)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_imports_nested_files(self):
+        res = import_folder(self.root, None, None, lambda _: "initializer")
+        self.assertEqual(res, {
+            os.path.join(self.root, "a.py"): "a",
+            os.path.join(self.root, "nested", "b.py"): "b",
+        })
+
+    def test_list_imports(self):
+        res = import_folder(self.root, None, None, lambda _: ["initializer", "other"])
+        self.assertEqual(res[os.path.join(self.root, "nested", "b.py")], ["b", "c"])
+        self.assertEqual(res[os.path.join(self.root, "a.py")], ["a"])
+
+    def test_order_filepaths(self):
+        res = import_folder(self.root, None, lambda l: sorted(l, reverse=True), lambda _: "initializer")
+        self.assertEqual(list(res.values()), ["b", "a"])
@@ -0,0 +1,22 @@
+import unittest
+from rainbows.model import ValidationError
+from rainbows.model.builtin_validators import BUILT_IN_VALIDATORS, FAST_BUILT_IN_VALIDATORS
+
+
+class BuiltinValidatorsTest(unittest.TestCase):
+    def test_bool_strings(self):
+        validator = BUILT_IN_VALIDATORS[bool]
+        for value in ["yes", "TRUE", "y", "t", "1"]:
+            self.assertIs(validator("key", value), True)
+        for value in ["no", "False", "n", "f", "0"]:
+            self.assertIs(validator("key", value), False)
+
+    def test_bool_invalid(self):
+        with self.assertRaises(ValidationError):
+            BUILT_IN_VALIDATORS[bool]("key", "maybe")
+
+    def test_fast_validators(self):
+        self.assertEqual(FAST_BUILT_IN_VALIDATORS.keys(), BUILT_IN_VALIDATORS.keys())
+        self.assertEqual(FAST_BUILT_IN_VALIDATORS[int]("key", 5), 5)
+        self.assertEqual(FAST_BUILT_IN_VALIDATORS[int]("key", "5"), 5)
+        self.assertEqual(FAST_BUILT_IN_VALIDATORS[str]("key", True), "true")
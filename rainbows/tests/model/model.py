@@ -0,0 +1,262 @@
+import functools
+import typing
+import unittest
+from rainbows.model import Model, ValidationError, validates
+
+
+class ModelTest(unittest.IsolatedAsyncioTestCase):
+    async def test_builtin_types(self):
+        class Example(Model):
+            a: int
+            b: str
+
+        self.assertEqual(await Example(a="1", b=2).validate(), {"a": 1, "b": "2"})
+
+    async def test_missing_key(self):
+        class Example(Model):
+            a: int
+
+        with self.assertRaises(ValidationError) as cm:
+            await Example().validate()
+        self.assertEqual(cm.exception.key_name, "a")
+
+    async def test_optional(self):
+        class Example(Model):
+            a: typing.Optional[int]
+
+        self.assertEqual(await Example().validate(), {"a": None})
+        self.assertEqual(await Example(a="2").validate(), {"a": 2})
+
+    async def test_nested_types(self):
+        class Example(Model):
+            a: typing.List[int]
+            b: typing.Dict[str, float]
+            c: typing.Set[str]
+
+        res = await Example(a=["1", 2], b={"x": "1.5"}, c=["y"]).validate()
+        self.assertEqual(res, {"a": [1, 2], "b": {"x": 1.5}, "c": {"y"}})
+
+    async def test_nested_key_name(self):
+        class Example(Model):
+            a: typing.List[int]
+
+        with self.assertRaises(ValidationError) as cm:
+            await Example(a=[1, "x"]).validate()
+        self.assertEqual(cm.exception.key_name, "a[1]")
+
+    async def test_defaults(self):
+        class Example(Model):
+            a: int = 1
+            b: str
+
+        model = Example(b="x")
+        self.assertTrue(model.is_default("a"))
+        self.assertEqual(model.a, 1)
+        self.assertEqual(await model.validate(), {"a": 1, "b": "x"})
+
+    async def test_validates_decorator(self):
+        class Example(Model):
+            a: int
+            b: int
+
+            @validates("a")
+            def add_one(self, value):
+                return value + 1
+
+            @validates()
+            async def double(self, value, key):
+                return value * 2
+
+        self.assertEqual(await Example(a=1, b="2").validate(), {"a": 3, "b": 4})
+
+    async def test_underscore_kwargs_ignored(self):
+        class Example(Model):
+            a: int
+
+        self.assertEqual(await Example(a=1, _b=2).validate(), {"a": 1})
+
+    async def test_custom_validate(self):
+        class Upper(object):
+            @staticmethod
+            def __validate__(value):
+                return value.upper()
+
+        class Lower(object):
+            @staticmethod
+            async def __validate__(value, key):
+                return value.lower()
+
+        class Example(Model):
+            a: Upper
+            b: typing.List[Lower]
+
+        self.assertEqual(await Example(a="x", b=["Y"]).validate(), {"a": "X", "b": ["y"]})
+
+    async def test_ignore_attribute(self):
+        class Example(Model):
+            a: int
+
+        model = Example(a=1, b=2)
+        model.ignore_attribute("b")
+        self.assertEqual(model.b, 2)
+        model.b = 3
+        self.assertEqual(model.b, 3)
+        self.assertNotIn("b", model)
+        self.assertEqual(await model.validate(), {"a": 1})
+
+    async def test_ignore_attribute_default(self):
+        class Example(Model):
+            a: int
+            b: str = "x"
+
+        model = Example(a=1)
+        model.ignore_attribute("b")
+        self.assertEqual(model.b, "x")
+        self.assertNotIn("b", model)
+
+    async def test_default_overrides(self):
+        class Example(Model):
+            a: int = 1
+
+        model = Example()
+        self.assertNotIn("a", model)
+        model.a = 2
+        self.assertFalse(model.is_default("a"))
+        self.assertIn("a", model)
+        del model.a
+        self.assertTrue(model.is_default("a"))
+        self.assertEqual(model["a"], 1)
+        with self.assertRaises(KeyError):
+            del model["a"]
+
+    async def test_deeply_nested_key_name(self):
+        class Example(Model):
+            a: typing.Dict[str, typing.List[int]]
+
+        with self.assertRaises(ValidationError) as cm:
+            await Example(a={"x": [1, 2, "y"]}).validate()
+        self.assertEqual(cm.exception.key_name, "a['x'][2]")
+
+    async def test_equality(self):
+        class Example(Model):
+            a: int
+            b: typing.Optional[int]
+
+        self.assertEqual(Example(a=1), Example(a=1))
+        self.assertNotEqual(Example(a=1), Example(a=2))
+        self.assertNotEqual(Example(a=1), Example(a=1, b=2))
+
+    async def test_dict_key_conversion(self):
+        class Example(Model):
+            a: typing.Dict[int, str]
+
+        self.assertEqual(await Example(a={"1": "x", "2": 3}).validate(), {"a": {1: "x", 2: "3"}})
+
+    async def test_inherited_and_string_annotations(self):
+        class Parent(Model):
+            a: "int"
+
+        class Child(Parent):
+            b: typing.Optional["str"] = None
+
+        self.assertEqual(Child().attributes(), {"a": int, "b": typing.Optional[str]})
+        self.assertEqual(await Child(a="1", b=2).validate(), {"a": 1, "b": "2"})
+
+    async def test_unknown_key(self):
+        class Example(Model):
+            a: int
+
+        model = Example(a=1)
+        model["b"] = 2
+        with self.assertRaises(ValidationError) as cm:
+            await model.validate()
+        self.assertEqual(cm.exception.key_name, "b")
+
+    async def test_union_order(self):
+        class IntFirst(Model):
+            a: typing.Union[int, str]
+
+        class StrFirst(Model):
+            a: typing.Union[str, int]
+
+        self.assertEqual(await IntFirst(a="5").validate(), {"a": 5})
+        self.assertEqual(await StrFirst(a="5").validate(), {"a": "5"})
+
+    async def test_union_unsupported_member(self):
+        class Unsupported(object):
+            pass
+
+        class Example(Model):
+            a: typing.Union[int, Unsupported]
+            b: typing.Optional[Unsupported]
+
+        self.assertEqual(await Example(a=1, b=None).validate(), {"a": 1, "b": None})
+        with self.assertRaises(TypeError):
+            await Example(a="x", b=None).validate()
+
+    async def test_bare_container(self):
+        class Example(Model):
+            a: typing.List
+
+        with self.assertRaises(TypeError):
+            await Example(a=[1]).validate()
+
+    async def test_wrapped_validator(self):
+        def deco(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                return fn(*args, **kwargs)
+            return wrapper
+
+        class Example(Model):
+            a: int
+
+            @validates("a")
+            @deco
+            def add_one(self, value):
+                return value + 1
+
+        self.assertEqual(await Example(a=1).validate(), {"a": 2})
+
+    async def test_element_error_does_not_rerun(self):
+        calls = []
+
+        class Checked(object):
+            @staticmethod
+            def __validate__(value, key):
+                calls.append(key)
+                if value == "bad":
+                    raise ValidationError(f"The value of key {key} is bad", key)
+                return value
+
+        class Example(Model):
+            a: typing.List[Checked]
+
+        with self.assertRaises(ValidationError) as cm:
+            await Example(a=["ok", "bad"]).validate()
+        self.assertEqual(cm.exception.key_name, "a[1]")
+        self.assertEqual(str(cm.exception), "The value of key a[1] is bad")
+        self.assertEqual(calls, ["a[0]", "a[1]"])
+
+    async def test_element_error_keeps_exception(self):
+        calls = []
+
+        class CustomError(ValidationError):
+            pass
+
+        class Checked(object):
+            @staticmethod
+            def __validate__(value):
+                calls.append(value)
+                if value == "bad":
+                    raise CustomError("Invalid value for field a", "a")
+                return value
+
+        class Example(Model):
+            a: typing.List[Checked]
+
+        with self.assertRaises(CustomError) as cm:
+            await Example(a=["ok", "bad"]).validate()
+        self.assertEqual(cm.exception.key_name, "a[1]")
+        self.assertEqual(str(cm.exception), "Invalid value for field a")
+        self.assertEqual(calls, ["ok", "bad"])
@@ -1,32 +1,31 @@
 from rainbows.bootstrap import bootstrapping_metadata
-import ntpath
+import os
 
 # 1) Get the app folder.
-app_path = ntpath.join(ntpath.dirname(__file__), "..", "..", "app")
+app_path = os.path.join(os.path.dirname(__file__), "..", "..", "app")
 
 # 2) Check the app folder exists.
-if ntpath.isdir(app_path):
-    # 3) Check if "models" exists. If so, add it.
-    models_path = ntpath.join(app_path, "models")
-    if ntpath.isdir(models_path):
-        bootstrapping_metadata.set_models_path(models_path)
+if os.path.isdir(app_path):
+    # 3) Read the folders within the app folder in one go.
+    with os.scandir(app_path) as it:
+        app_dirs = {entry.name for entry in it if entry.is_dir()}
 
-    # 4) Check if "views" exists. If so, add it.
-    views_path = ntpath.join(app_path, "views")
-    if ntpath.isdir(views_path):
-        bootstrapping_metadata.set_views_path(views_path)
+    # 4) Check if "models" exists. If so, add it.
+    if "models" in app_dirs:
+        bootstrapping_metadata.set_models_path(os.path.join(app_path, "models"))
 
-    # 5) Check if "controllers" exists. If so, add it.
-    controllers_path = ntpath.join(app_path, "controllers")
-    if ntpath.isdir(controllers_path):
-        bootstrapping_metadata.set_controllers_path(controllers_path)
+    # 5) Check if "views" exists. If so, add it.
+    if "views" in app_dirs:
+        bootstrapping_metadata.set_views_path(os.path.join(app_path, "views"))
 
-    # 6) Check if "helpers" exists. If so, add it.
-    helpers_path = ntpath.join(app_path, "helpers")
-    if ntpath.isdir(helpers_path):
-        bootstrapping_metadata.set_helpers_path(helpers_path)
+    # 6) Check if "controllers" exists. If so, add it.
+    if "controllers" in app_dirs:
+        bootstrapping_metadata.set_controllers_path(os.path.join(app_path, "controllers"))
 
-    # 6) Check if "services" exists. If so, add it.
-    services_path = ntpath.join(app_path, "services")
-    if ntpath.isdir(services_path):
-        bootstrapping_metadata.set_services_path(services_path)
+    # 7) Check if "helpers" exists. If so, add it.
+    if "helpers" in app_dirs:
+        bootstrapping_metadata.set_helpers_path(os.path.join(app_path, "helpers"))
+
+    # 8) Check if "services" exists. If so, add it.
+    if "services" in app_dirs:
+        bootstrapping_metadata.set_services_path(os.path.join(app_path, "services"))
@@ -4,7 +4,7 @@
 # harder. Please don't!
 
 import rainbows.bootstrap
-import ntpath
+import os
 
 if __name__ == "__main__":
-    rainbows.bootstrap.run(ntpath.dirname(__file__))
+    rainbows.bootstrap.run(os.path.dirname(__file__))